@@ -1,20 +1,31 @@
+import argparse
+import csv
 import os
 import random
 import re
+import shutil
 import signal
 import socket
 import statistics
 import subprocess
 import sys
+import tempfile
 import time
+import urllib.request
 
 # Configuration
 PORT = 8001
 DURATION = "10s"
 CONNECTIONS = 100
 THREADS = 2
-NUM_RUNS = 3
+NUM_RUNS = 5
+WARMUP_SECONDS = 0.5
+PERCENTILES = (50, 90, 99)
+LATENCY_UNITS_US = {"us": 1, "ms": 1_000, "s": 1_000_000}
 WRK_PATH = "wrk"
+# Disjoint CPU sets for the server and wrk when running with --pin
+SERVER_CPUS = "2"
+WRK_CPUS = "4,5"
 CWD = os.path.join(os.path.dirname(__file__), "example")
 
 CONFIGS = [
@@ -34,10 +45,56 @@ def wait_for_port(port, timeout=5):
     return False
 
 
-def run_benchmark(config):
+def pin_command(cmd, cpus, pin):
+    # Prefix the command with taskset when pinning is requested
+    if pin:
+        return ["taskset", "-c", cpus, *cmd]
+    return cmd
+
+
+def parse_cpus(cpus):
+    # Expand a taskset CPU list such as "2" or "4,5" or "4-7" into a set
+    result = set()
+    for part in cpus.split(","):
+        start, _, end = part.partition("-")
+        result.update(range(int(start), int(end or start) + 1))
+    return result
+
+
+def can_pin():
+    # Pinning needs taskset and both CPU sets to be available to this process
+    if not shutil.which("taskset") or not hasattr(os, "sched_getaffinity"):
+        print("Warning: 'taskset' not found, running without CPU pinning.")
+        return False
+
+    available = os.sched_getaffinity(0)
+    missing = (parse_cpus(SERVER_CPUS) | parse_cpus(WRK_CPUS)) - available
+    if missing:
+        print(
+            f"Warning: CPUs {sorted(missing)} are not available (have "
+            f"{sorted(available)}), running without CPU pinning."
+        )
+        return False
+
+    return True
+
+
+def warmup(port, duration=WARMUP_SECONDS):
+    # Hit the server before timing so first-request costs (URL resolver,
+    # middleware, interpreter specialization) don't end up in the results
+    url = f"http://127.0.0.1:{port}/"
+    start = time.time()
+    while time.time() - start < duration:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                response.read()
+        except OSError:
+            time.sleep(0.01)
+
+
+def start_server(config, pin=False):
     print(f"--- Benchmarking {config['name']} ---")
 
-    # Start Server
     cmd = [
         "granian",
         "--interface",
@@ -52,36 +109,50 @@ def run_benchmark(config):
         "--log-level",
         "warning",
     ]
+    cmd = pin_command(cmd, SERVER_CPUS, pin)
 
-    try:
-        # Start the server process
-        # We use a new session to easily kill the process tree later
-        server_process = subprocess.Popen(
-            cmd,
-            cwd=CWD,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.PIPE,
-            preexec_fn=os.setsid,
-        )
-    except FileNotFoundError:
-        print("Error: 'granian' command not found. Please install dependencies.")
-        return None
+    # Collect stderr in a temp file rather than a pipe: the server runs for
+    # all of its wrk runs, and nothing reads a pipe once it has started, so
+    # enough log output would fill the pipe buffer and block the server
+    with tempfile.TemporaryFile() as stderr_file:
+        try:
+            # Start the server process
+            # We use a new session to easily kill the process tree later
+            server_process = subprocess.Popen(
+                cmd,
+                cwd=CWD,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr_file,
+                preexec_fn=os.setsid,
+            )
+        except FileNotFoundError:
+            print("Error: 'granian' command not found. Please install dependencies.")
+            return None
 
-    if not wait_for_port(PORT):
-        print(f"Failed to start server for {config['name']}")
-        # Try to read stderr
-        _, stderr = server_process.communicate()
-        if stderr:
-            print("Server error output:")
-            print(stderr.decode("utf-8") if isinstance(stderr, bytes) else stderr)
+        if not wait_for_port(PORT):
+            print(f"Failed to start server for {config['name']}")
+            stop_server(server_process)
 
-        try:
-            os.killpg(os.getpgid(server_process.pid), signal.SIGTERM)
-        except ProcessLookupError:
-            pass
-        return None
+            stderr_file.seek(0)
+            if stderr := stderr_file.read():
+                print("Server error output:")
+                print(stderr.decode("utf-8", errors="replace"))
+            return None
+
+    warmup(PORT)
 
-    # Run wrk
+    return server_process
+
+
+def stop_server(server_process):
+    try:
+        os.killpg(os.getpgid(server_process.pid), signal.SIGTERM)
+        server_process.wait(timeout=5)
+    except (ProcessLookupError, subprocess.TimeoutExpired):
+        pass
+
+
+def run_wrk(pin=False):
     wrk_cmd = [
         WRK_PATH,
         "-t",
@@ -90,68 +161,134 @@ def run_benchmark(config):
         str(CONNECTIONS),
         "-d",
         DURATION,
+        "--latency",
         f"http://127.0.0.1:{PORT}/",
     ]
+    wrk_cmd = pin_command(wrk_cmd, WRK_CPUS, pin)
 
-    try:
-        result = subprocess.run(wrk_cmd, capture_output=True, text=True)
-        output = result.stdout
-    except FileNotFoundError:
-        print("Error: 'wrk' not found or not executable. Please install 'wrk'.")
-        # Kill server
-        try:
-            os.killpg(os.getpgid(server_process.pid), signal.SIGTERM)
-        except ProcessLookupError:
-            pass
-        sys.exit(1)
+    # Let FileNotFoundError propagate so the caller can stop the server
+    result = subprocess.run(wrk_cmd, capture_output=True, text=True)
+    output = result.stdout
 
-    # Stop Server
-    try:
-        os.killpg(os.getpgid(server_process.pid), signal.SIGTERM)
-        server_process.wait(timeout=5)
-    except (ProcessLookupError, subprocess.TimeoutExpired):
-        pass
+    result = parse_wrk_output(output)
+    if result is None:
+        print("Could not parse wrk output")
+        print(output)
+        return {"rps": 0.0, **{f"p{p}": None for p in PERCENTILES}}
+
+    print(
+        f"Result: {result['rps']:,.2f} req/sec, "
+        f"p50 {format_latency(result['p50'])}, p99 {format_latency(result['p99'])}"
+    )
+    return result
 
-    # Parse RPS
+
+def parse_wrk_output(output):
     # Output example: requests/sec:  49392.34
     match = re.search(r"Requests/sec:\s+([\d.]+)", output)
-    if match:
-        rps = float(match.group(1))
-        print(f"Result: {rps:,.2f} req/sec")
-        return rps
-    else:
-        print("Could not parse wrk output")
-        print(output)
-        return 0
+    if not match:
+        return None
+
+    result = {"rps": float(match.group(1))}
+
+    # Latency distribution example:      99%    4.13ms
+    for percentile in PERCENTILES:
+        match = re.search(
+            rf"^\s*{percentile}%\s+([\d.]+)(us|ms|s)\s*$", output, re.MULTILINE
+        )
+        if match:
+            value, unit = match.groups()
+            result[f"p{percentile}"] = float(value) * LATENCY_UNITS_US[unit]
+        else:
+            result[f"p{percentile}"] = None
+
+    return result
+
+
+def format_latency(latency_us):
+    if latency_us is None:
+        return "n/a"
+    return f"{latency_us:,.0f}us"
+
+
+def summarize(values):
+    # Drop the fastest and slowest run before averaging, once there are
+    # enough runs for that to leave something
+    trimmed = sorted(values)[1:-1] if len(values) > 2 else values
+
+    return {
+        "median": statistics.median(values),
+        "mean": statistics.mean(trimmed),
+        "stdev": statistics.stdev(values) if len(values) > 1 else 0.0,
+        "min": min(values),
+        "max": max(values),
+    }
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Benchmark WSGI, ASGI and RSGI.")
+    parser.add_argument(
+        "--pin",
+        action="store_true",
+        help=f"pin the server to CPU {SERVER_CPUS} and wrk to CPUs {WRK_CPUS}",
+    )
+    parser.add_argument(
+        "--csv",
+        metavar="PATH",
+        help="also write every run's results to a CSV file",
+    )
+    args = parser.parse_args()
+
+    if args.pin:
+        args.pin = can_pin()
+
     print(f"Running benchmarks (Duration: {DURATION}, Connections: {CONNECTIONS})...")
     print(f"Command used: granian --workers 1 --threads 1 ...")
-    print(f"Averaging over {NUM_RUNS} runs in random order.")
+    print(f"Aggregating {NUM_RUNS} runs per interface, interfaces in random order.")
 
     # Dictionary to store list of results for each interface
     all_results = {c["name"]: [] for c in CONFIGS}
 
-    for i in range(NUM_RUNS):
-        print(f"\n=== Run {i + 1}/{NUM_RUNS} ===")
-        # Shuffle a copy of the configs to randomize order
-        run_configs = list(CONFIGS)
-        random.shuffle(run_configs)
+    # Shuffle a copy of the configs to randomize order. Each server is kept
+    # running for all of its runs so it stays warm between them.
+    run_configs = list(CONFIGS)
+    random.shuffle(run_configs)
+
+    for config in run_configs:
+        server_process = start_server(config, pin=args.pin)
+        if server_process is None:
+            continue
+
+        try:
+            for i in range(NUM_RUNS):
+                print(f"Run {i + 1}/{NUM_RUNS}")
+                all_results[config["name"]].append(run_wrk(pin=args.pin))
+        except FileNotFoundError:
+            print("Error: 'wrk' not found or not executable. Please install 'wrk'.")
+            sys.exit(1)
+        finally:
+            stop_server(server_process)
 
-        for config in run_configs:
-            rps = run_benchmark(config)
-            if rps is not None:
-                all_results[config["name"]].append(rps)
+    if args.csv:
+        write_csv(args.csv, all_results)
 
-    print("\n\n=== Final Results (Average) ===")
+    print("\n\n=== Final Results ===")
 
-    # Calculate averages
+    # Calculate statistics
     final_stats = []
-    for name, values in all_results.items():
-        if values:
-            avg_rps = statistics.mean(values)
-            final_stats.append((name, avg_rps))
+    for name, results in all_results.items():
+        if results:
+            stats = summarize([r["rps"] for r in results])
+            for percentile in PERCENTILES:
+                latencies = [
+                    r[f"p{percentile}"]
+                    for r in results
+                    if r[f"p{percentile}"] is not None
+                ]
+                stats[f"p{percentile}"] = (
+                    statistics.median(latencies) if latencies else None
+                )
+            final_stats.append((name, stats))
         else:
             print(f"No successful runs for {name}")
 
@@ -159,14 +296,36 @@ def main():
         print("No results obtained.")
         return
 
-    final_stats.sort(key=lambda x: x[1], reverse=True)
-    baseline = final_stats[0][1]
+    final_stats.sort(key=lambda x: x[1]["median"], reverse=True)
+    baseline = final_stats[0][1]["median"]
+
+    print(
+        f"{'Interface':<10} {'Median':>12} {'Mean (trim)':>12} {'Stdev':>10} "
+        f"{'Min':>12} {'Max':>12} {'p50':>10} {'p99':>10} {'% relative':>11}"
+    )
+    print("-" * 106)
+    for name, stats in final_stats:
+        pct = (stats["median"] / baseline) * 100
+        print(
+            f"{name:<10} {stats['median']:12,.2f} {stats['mean']:12,.2f} "
+            f"{stats['stdev']:10,.2f} {stats['min']:12,.2f} {stats['max']:12,.2f} "
+            f"{format_latency(stats['p50']):>10} {format_latency(stats['p99']):>10} "
+            f"{pct:10.1f}%"
+        )
+
 
-    print(f"{'Interface':<10} {'Req/Sec (Avg)':<15} {'% relative':<12}")
-    print("-" * 45)
-    for name, rps in final_stats:
-        pct = (rps / baseline) * 100
-        print(f"{name:<10} {rps:10,.2f}      {pct:6.1f}%")
+def write_csv(path, all_results):
+    fieldnames = ["interface", "run", "rps"] + [f"p{p}_us" for p in PERCENTILES]
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for name, results in all_results.items():
+            for i, result in enumerate(results, start=1):
+                row = {"interface": name, "run": i, "rps": result["rps"]}
+                for percentile in PERCENTILES:
+                    row[f"p{percentile}_us"] = result[f"p{percentile}"]
+                writer.writerow(row)
+    print(f"Wrote per-run results to {path}")
 
 
 if __name__ == "__main__":
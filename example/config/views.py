@@ -1,11 +1,12 @@
 from django.http import HttpResponse
 
+# Encoded once at import so index() doesn't re-encode a constant body
+INDEX_CONTENT = b"<h1>Django RSGI is running!</h1><p>Served by Granian via RSGI.</p>"
+
 
 async def index(request):
-    return HttpResponse(
-        "<h1>Django RSGI is running!</h1><p>Served by Granian via RSGI.</p>"
-    )
+    return HttpResponse(INDEX_CONTENT)
 
 
 async def hello(request, name):
-    return HttpResponse(f"Hello, {name}!")
+    return HttpResponse(f"Hello, {name}!".encode())
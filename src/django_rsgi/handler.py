@@ -1,13 +1,20 @@
 import io
 import logging
 import sys
+import tempfile
 import traceback
 from contextlib import aclosing, closing
+from functools import lru_cache
+from urllib.parse import parse_qsl
 
 from asgiref.sync import ThreadSensitiveContext, sync_to_async
 from django.conf import settings
 from django.core import signals
-from django.core.exceptions import RequestAborted, RequestDataTooBig
+from django.core.exceptions import (
+    RequestAborted,
+    RequestDataTooBig,
+    TooManyFieldsSent,
+)
 from django.core.handlers import base
 from django.http import (
     FileResponse,
@@ -44,6 +51,65 @@ _HEADER_NAME_CACHE = {
     "x-requested-with": "HTTP_X_REQUESTED_WITH",
 }
 
+# Static META entries shared by every request, copied instead of rebuilt
+_META_TEMPLATE = {
+    "wsgi.multithread": True,
+    "wsgi.multiprocess": True,
+    "SERVER_NAME": "unknown",
+    "SERVER_PORT": "0",
+}
+
+# Methods whose HTTP/1.x requests carry no body unless they announce one
+# with headers
+_BODYLESS_METHODS = frozenset(("GET", "HEAD", "DELETE", "OPTIONS"))
+
+
+# Only query strings up to this length are memoized, so arbitrarily long
+# client-controlled strings can't fill the cache
+_MAX_CACHED_QUERY_STRING_LENGTH = 256
+
+
+def _parse_query_string(query_string, encoding, max_num_fields):
+    values = {}
+    for key, value in parse_qsl(
+        query_string,
+        keep_blank_values=True,
+        encoding=encoding,
+        max_num_fields=max_num_fields,
+    ):
+        values.setdefault(key, []).append(value)
+    return tuple((key, tuple(key_values)) for key, key_values in values.items())
+
+
+_parse_cached_query_string = lru_cache(maxsize=1024)(_parse_query_string)
+
+
+def get_query_dict(query_string):
+    """
+    Return an immutable QueryDict for a query string, parsing each distinct
+    short query string only once.
+    """
+    encoding = settings.DEFAULT_CHARSET
+    if len(query_string) <= _MAX_CACHED_QUERY_STRING_LENGTH:
+        parse = _parse_cached_query_string
+    else:
+        parse = _parse_query_string
+    try:
+        pairs = parse(query_string, encoding, settings.DATA_UPLOAD_MAX_NUMBER_FIELDS)
+    except ValueError as e:
+        # Mirror QueryDict: parse_qsl only raises here for too many fields
+        raise TooManyFieldsSent(
+            "The number of GET/POST parameters exceeded "
+            "settings.DATA_UPLOAD_MAX_NUMBER_FIELDS."
+        ) from e
+
+    # Keys and values are already text, so fill the value lists directly
+    # instead of converting them again through appendlist()
+    query_dict = QueryDict(encoding=encoding)
+    for key, values in pairs:
+        dict.__setitem__(query_dict, key, list(values))
+    return query_dict
+
 
 def get_normalized_header_name(name):
     """
@@ -62,6 +128,30 @@ def get_normalized_header_name(name):
         return res
 
 
+@lru_cache(maxsize=1024)
+def parse_client_address(client):
+    """
+    Split an RSGI client address into (host, port). Port is None if missing.
+    """
+    try:
+        host, port = client.rsplit(":", 1)
+        return host, int(port)
+    except ValueError:
+        return client, None
+
+
+@lru_cache(maxsize=16)
+def parse_server_address(server):
+    """
+    Split an RSGI server address into (host, port). Port is None if missing.
+    """
+    try:
+        host, port = server.rsplit(":", 1)
+        return host, port
+    except ValueError:
+        return server, None
+
+
 def get_script_prefix(scope):
     """
     Return the script prefix to use from either the scope or a setting.
@@ -77,11 +167,14 @@ class RSGIRequest(HttpRequest):
     and wraps request body handling.
     """
 
+    # Optimization: Per-request defaults live on the class so they aren't
+    # written into every instance's __dict__.
+    _post_parse_error = False
+    _read_started = False
+    resolver_match = None
+
     def __init__(self, scope, body_file, script_prefix=None):
         self.scope = scope
-        self._post_parse_error = False
-        self._read_started = False
-        self.resolver_match = None
 
         path = scope.path
         self.path = path
@@ -100,62 +193,53 @@ class RSGIRequest(HttpRequest):
         method = scope.method
         self.method = method
 
-        # Initialize META with basic info
-        self.META = {
-            "REQUEST_METHOD": method,
-            "QUERY_STRING": scope.query_string or "",
-            "SCRIPT_NAME": script_prefix,
-            "PATH_INFO": self.path_info,
-            "wsgi.multithread": True,
-            "wsgi.multiprocess": True,
-        }
+        # Initialize META from the static template, then add per-request info
+        meta = _META_TEMPLATE.copy()
+        meta["REQUEST_METHOD"] = method
+        meta["QUERY_STRING"] = scope.query_string or ""
+        meta["SCRIPT_NAME"] = script_prefix
+        meta["PATH_INFO"] = self.path_info
+        self.META = meta
 
         # Client/Server parsing
+        # Optimization: Addresses repeat across keep-alive requests, so their
+        # parses are cached
         client = scope.client
         if client:
-            try:
-                host, port = client.rsplit(":", 1)
-                self.META["REMOTE_ADDR"] = host
-                self.META["REMOTE_HOST"] = host
-                self.META["REMOTE_PORT"] = int(port)
-            except ValueError:
-                self.META["REMOTE_ADDR"] = client
+            host, port = parse_client_address(client)
+            meta["REMOTE_ADDR"] = host
+            if port is not None:
+                meta["REMOTE_HOST"] = host
+                meta["REMOTE_PORT"] = port
 
         server = scope.server
         if server:
-            try:
-                host, port = server.rsplit(":", 1)
-                self.META["SERVER_NAME"] = host
-                self.META["SERVER_PORT"] = str(port)
-            except ValueError:
-                self.META["SERVER_NAME"] = server
-        else:
-            self.META["SERVER_NAME"] = "unknown"
-            self.META["SERVER_PORT"] = "0"
+            host, port = parse_server_address(server)
+            meta["SERVER_NAME"] = host
+            if port is not None:
+                meta["SERVER_PORT"] = port
 
-        # Headers normalization loop
-        meta = self.META
-        headers = scope.headers
+        # Headers normalization: collect the values for each META key in a
+        # single pass over the raw (name, value) pairs, then join once per key
         header_name_cache = _HEADER_NAME_CACHE
+        header_values = {}
+        # Optimization: Bind the per-header method lookup once, outside the loop
+        add_header_value = header_values.setdefault
 
-        for name in headers:
+        for name, value in scope.headers.items():
             try:
                 corrected_name = header_name_cache[name]
             except KeyError:
                 corrected_name = get_normalized_header_name(name)
 
-            # Using get_all to join multiple header values as per Django standards
-            values = headers.get_all(name)
-            value = ",".join(values)
+            add_header_value(corrected_name, []).append(value)
 
+        for corrected_name, values in header_values.items():
             if corrected_name == "HTTP_COOKIE":
-                value = value.rstrip("; ")
-                if "HTTP_COOKIE" in meta:
-                    value = meta["HTTP_COOKIE"] + "; " + value
-            elif corrected_name in meta:
-                value = meta[corrected_name] + "," + value
-
-            meta[corrected_name] = value
+                meta[corrected_name] = "; ".join(value.rstrip("; ") for value in values)
+            else:
+                # Join multiple header values with a comma as per Django standards
+                meta[corrected_name] = ",".join(values)
 
         # Pull out request encoding, if provided.
         self._set_content_type_params(meta)
@@ -164,7 +248,10 @@ class RSGIRequest(HttpRequest):
 
     @cached_property
     def GET(self):
-        return QueryDict(self.META["QUERY_STRING"])
+        if query_string := self.META["QUERY_STRING"]:
+            return get_query_dict(query_string)
+        # The cached parse only adds overhead for an empty query string
+        return QueryDict()
 
     def _get_scheme(self):
         return self.scope.scheme or super()._get_scheme()
@@ -187,7 +274,9 @@ class RSGIRequest(HttpRequest):
 
     @cached_property
     def COOKIES(self):
-        return parse_cookie(self.META.get("HTTP_COOKIE", ""))
+        if cookie := self.META.get("HTTP_COOKIE"):
+            return parse_cookie(cookie)
+        return {}
 
     def close(self):
         super().close()
@@ -204,6 +293,12 @@ class RSGIHandler(base.BaseHandler):
         super().__init__()
         self.load_middleware(is_async=True)
 
+        # Optimization: Bind lookups used on every request once
+        self._cls = type(self)
+        self._get_response_async = self.get_response_async
+        self._request_started_send = signals.request_started.asend
+        self._request_finished_send = signals.request_finished.asend
+
     async def __call__(self, scope, protocol):
         """
         Async entrypoint - parses the request and hands off to get_response.
@@ -218,18 +313,30 @@ class RSGIHandler(base.BaseHandler):
         """
         Handles the RSGI request.
         """
-        try:
-            body = await protocol()
-        except Exception:
-            return
+        # Optimization: Don't wait on the body of requests that cannot have one.
+        # Only HTTP/1.x requires framing headers for a body; HTTP/2 and HTTP/3
+        # can stream one without Content-Length (and forbid Transfer-Encoding).
+        headers = scope.headers
+        if (
+            scope.http_version.startswith("1")
+            and scope.method in _BODYLESS_METHODS
+            and "content-length" not in headers
+            and "transfer-encoding" not in headers
+        ):
+            body_file = io.BytesIO()
+        else:
+            try:
+                body_file = await self.read_body(protocol)
+            except Exception:
+                return
 
-        with closing(io.BytesIO(body)) as body_file:
+        with closing(body_file):
             script_prefix = get_script_prefix(scope)
             set_script_prefix(script_prefix)
 
             # Optimization: Skip signal emission if no receivers connected
             if signals.request_started.receivers:
-                await signals.request_started.asend(sender=self.__class__, scope=scope)
+                await self._request_started_send(sender=self._cls, scope=scope)
 
             # Get the request and check for basic issues.
             request, error_response = self.create_request(
@@ -252,12 +359,27 @@ class RSGIHandler(base.BaseHandler):
 
             if response is None:
                 if signals.request_finished.receivers:
-                    await signals.request_finished.asend(sender=self.__class__)
+                    await self._request_finished_send(sender=self._cls)
+
+    async def read_body(self, protocol):
+        """Read the request body and return it as a file-like object."""
+        body = await protocol()
+
+        # Optimization: Wrap small bodies directly instead of round-tripping
+        # them through a SpooledTemporaryFile.
+        max_size = settings.FILE_UPLOAD_MAX_MEMORY_SIZE
+        if len(body) <= max_size:
+            return io.BytesIO(body)
+
+        body_file = tempfile.SpooledTemporaryFile(max_size=max_size, mode="w+b")
+        body_file.write(body)
+        body_file.seek(0)
+        return body_file
 
     async def run_get_response(self, request):
         """Get async response."""
-        response = await self.get_response_async(request)
-        response._handler_class = self.__class__
+        response = await self._get_response_async(request)
+        response._handler_class = self._cls
         if isinstance(response, FileResponse):
             response.block_size = self.chunk_size
         return response
@@ -293,6 +415,14 @@ class RSGIHandler(base.BaseHandler):
 
     async def send_response(self, response, protocol):
         """Encode and send a response out over RSGI."""
+        # Optimization: Plain in-memory responses without cookies skip the
+        # cookie, file and streaming checks entirely.
+        if type(response) is HttpResponse and not response.cookies:
+            protocol.response_bytes(
+                response.status_code, list(response.items()), response.content
+            )
+            return
+
         response_headers = [(header, value) for header, value in response.items()]
         if response.cookies:
             # OutputString() is relatively slow but necessary
@@ -3,21 +3,32 @@ import asyncio
 
 class MockRSGIHeaders:
     def __init__(self, headers):
-        self._headers = headers
+        # Lowercase names once up front, as RSGI servers deliver them, and
+        # flatten repeated headers into (name, value) pairs
+        items = []
+        for name, val in headers.items():
+            values = val if isinstance(val, list) else [val]
+            items.extend((name.lower(), value) for value in values)
+        self._items = tuple(items)
+        self._names = dict.fromkeys(name for name, _ in items)
 
     def __iter__(self):
-        return iter(self._headers.keys())
+        return iter(self._names)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def items(self):
+        return list(self._items)
 
     def get_all(self, name):
-        val = self._headers.get(name.lower())
-        if val is None:
-            return []
-        if isinstance(val, list):
-            return val
-        return [val]
+        return [value for key, value in self._items if key == name]
 
-    def get(self, name):
-        return self._headers.get(name.lower())
+    def get(self, name, default=None):
+        for key, value in self._items:
+            if key == name:
+                return value
+        return default
 
 
 class MockRSGIScope:
@@ -45,49 +56,55 @@ class MockRSGIScope:
 
 class MockRSGITransport:
     def __init__(self):
-        self.sent_data = []
+        self.sent_data = bytearray()
 
     async def send_bytes(self, data):
-        self.sent_data.append(data)
+        self.sent_data += data
 
     async def send_str(self, data):
-        self.sent_data.append(data.encode("utf-8"))
+        self.sent_data += data.encode("utf-8")
 
 
 class MockRSGIProtocol:
     def __init__(self, body=b""):
         self.body = body
+        self.body_read = False
         self.response = None
         self.transport = MockRSGITransport()
         self.disconnected = asyncio.Future()
 
     async def __call__(self):
+        self.body_read = True
         return self.body
 
     async def client_disconnect(self):
         await self.disconnected
 
-    def response_empty(self, status, headers):
-        self.response = {"status": status, "headers": headers, "body": b""}
-
-    def response_str(self, status, headers, body):
+    def _set_response(self, status, headers, body):
+        # Keep the ordered header list and also index it by name
+        header_map = {}
+        for name, value in headers:
+            header_map.setdefault(name, []).append(value)
         self.response = {
             "status": status,
             "headers": headers,
-            "body": body.encode("utf-8"),
+            "header_map": header_map,
+            "body": body,
         }
 
+    def response_empty(self, status, headers):
+        self._set_response(status, headers, b"")
+
+    def response_str(self, status, headers, body):
+        self._set_response(status, headers, body.encode("utf-8"))
+
     def response_bytes(self, status, headers, body):
-        self.response = {"status": status, "headers": headers, "body": body}
+        self._set_response(status, headers, body)
 
     def response_file(self, status, headers, file):
         with open(file, "rb") as f:
-            self.response = {"status": status, "headers": headers, "body": f.read()}
+            self._set_response(status, headers, f.read())
 
     def response_stream(self, status, headers):
-        self.response = {
-            "status": status,
-            "headers": headers,
-            "body": self.transport.sent_data,
-        }
+        self._set_response(status, headers, self.transport.sent_data)
         return self.transport
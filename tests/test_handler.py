@@ -1,10 +1,21 @@
 import io
 
+from asgiref.sync import async_to_sync
+from django.core.exceptions import TooManyFieldsSent
+from django.http import QueryDict
 from django.test import SimpleTestCase
+from django.urls import set_script_prefix
 
-from django_rsgi.handler import RSGIHandler, RSGIRequest
+from django_rsgi.handler import (
+    _MAX_CACHED_QUERY_STRING_LENGTH,
+    RSGIHandler,
+    RSGIRequest,
+    _parse_cached_query_string,
+    get_normalized_header_name,
+    get_query_dict,
+)
 
-from .mocks import MockRSGIScope
+from .mocks import MockRSGIProtocol, MockRSGIScope
 
 
 class RSGIRequestTests(SimpleTestCase):
@@ -24,6 +35,42 @@ class RSGIRequestTests(SimpleTestCase):
         self.assertEqual(request.META["HTTP_USER_AGENT"], "test-agent")
         self.assertEqual(request.META["HTTP_X_CUSTOM"], "value")
 
+    def test_request_meta_mixed_case_headers(self):
+        scope = MockRSGIScope(
+            headers={"Content-Type": "text/plain", "X-Custom": ["a", "b"]}
+        )
+        request = RSGIRequest(scope, io.BytesIO(b""))
+
+        self.assertEqual(request.META["CONTENT_TYPE"], "text/plain")
+        self.assertEqual(request.META["HTTP_X_CUSTOM"], "a,b")
+
+    def test_request_meta_repeated_headers(self):
+        scope = MockRSGIScope(
+            headers={
+                "accept": ["text/html", "application/json"],
+                "cookie": ["a=1; ", "b=2"],
+            }
+        )
+        request = RSGIRequest(scope, io.BytesIO(b""))
+
+        self.assertEqual(request.META["HTTP_ACCEPT"], "text/html,application/json")
+        self.assertEqual(request.META["HTTP_COOKIE"], "a=1; b=2")
+        self.assertEqual(request.COOKIES, {"a": "1", "b": "2"})
+
+    def test_request_empty_query_string_and_cookies(self):
+        first = RSGIRequest(MockRSGIScope(), io.BytesIO(b""))
+        second = RSGIRequest(MockRSGIScope(), io.BytesIO(b""))
+
+        self.assertEqual(len(first.GET), 0)
+        self.assertFalse(first.GET._mutable)
+
+        # Mutating one request's GET must not leak into another request
+        first.GET._mutable = True
+        first.GET["injected"] = "1"
+        self.assertNotIn("injected", second.GET)
+        self.assertEqual(first.COOKIES, {})
+        self.assertIsNot(first.COOKIES, second.COOKIES)
+
     def test_request_meta_client_server(self):
         scope = MockRSGIScope(client="1.2.3.4:5678", server="8.8.8.8:80")
         request = RSGIRequest(scope, io.BytesIO(b""))
@@ -50,6 +97,43 @@ class RSGIRequestTests(SimpleTestCase):
         self.assertEqual(request.script_name, "/prefix")
 
 
+class QueryDictTests(SimpleTestCase):
+    def test_get_query_dict(self):
+        query_string = "a=1&b=&a=2&c=hello%20world"
+        first = get_query_dict(query_string)
+        second = get_query_dict(query_string)
+
+        self.assertEqual(first, QueryDict(query_string))
+        self.assertEqual(first.getlist("a"), ["1", "2"])
+        self.assertIsNot(first, second)
+        # The cached parse must not share value lists between QueryDicts
+        self.assertIsNot(dict.__getitem__(first, "a"), dict.__getitem__(second, "a"))
+        self.assertFalse(first._mutable)
+
+    def test_get_query_dict_long_query_string_not_cached(self):
+        query_string = "a=" + "x" * _MAX_CACHED_QUERY_STRING_LENGTH
+        cache_info = _parse_cached_query_string.cache_info()
+
+        query_dict = get_query_dict(query_string)
+
+        self.assertEqual(query_dict, QueryDict(query_string))
+        self.assertFalse(query_dict._mutable)
+        # Neither a hit nor a miss: the cache was bypassed entirely
+        self.assertEqual(_parse_cached_query_string.cache_info(), cache_info)
+
+    def test_get_query_dict_too_many_fields(self):
+        with self.settings(DATA_UPLOAD_MAX_NUMBER_FIELDS=2):
+            with self.assertRaises(TooManyFieldsSent):
+                get_query_dict("a=1&b=2&c=3")
+
+
+class HeaderNameTests(SimpleTestCase):
+    def test_get_normalized_header_name(self):
+        self.assertEqual(get_normalized_header_name("content-type"), "CONTENT_TYPE")
+        self.assertEqual(get_normalized_header_name("x-custom-id"), "HTTP_X_CUSTOM_ID")
+        self.assertEqual(get_normalized_header_name("X-Mixed-9"), "HTTP_X_MIXED_9")
+
+
 class RSGIHandlerTests(SimpleTestCase):
     def test_create_request_success(self):
         handler = RSGIHandler()
@@ -60,3 +144,69 @@ class RSGIHandlerTests(SimpleTestCase):
         self.assertIsInstance(request, RSGIRequest)
         self.assertIsNone(error)
         self.assertEqual(request.body, b"test body")
+
+    def test_force_script_name(self):
+        handler = RSGIHandler()
+        scope = MockRSGIScope(path="/forced/")
+        protocol = MockRSGIProtocol()
+        # async_to_sync copies the script prefix set by handle() back into
+        # this context, so reset it for the tests that follow
+        self.addCleanup(set_script_prefix, "/")
+
+        with self.settings(FORCE_SCRIPT_NAME="/forced"):
+            async_to_sync(handler.handle)(scope, protocol)
+
+        self.assertEqual(protocol.response["status"], 200)
+        self.assertEqual(protocol.response["body"], b"Hello World!")
+
+    def test_handle_skips_body_without_content_length(self):
+        handler = RSGIHandler()
+        scope = MockRSGIScope(path="/post/", query_string="echo=1")
+        protocol = MockRSGIProtocol()
+
+        async_to_sync(handler.handle)(scope, protocol)
+
+        self.assertFalse(protocol.body_read)
+        self.assertEqual(protocol.response["status"], 200)
+        self.assertEqual(protocol.response["body"], b"")
+
+    def test_handle_reads_http2_body_without_content_length(self):
+        handler = RSGIHandler()
+        scope = MockRSGIScope(method="DELETE", path="/post/", query_string="echo=1")
+        scope.http_version = "2"
+        protocol = MockRSGIProtocol(body=b"streamed")
+
+        async_to_sync(handler.handle)(scope, protocol)
+
+        self.assertTrue(protocol.body_read)
+        self.assertEqual(protocol.response["body"], b"streamed")
+
+    def test_handle_reads_body_with_content_length(self):
+        handler = RSGIHandler()
+        scope = MockRSGIScope(
+            method="DELETE",
+            path="/post/",
+            query_string="echo=1",
+            headers={"content-length": "4"},
+        )
+        protocol = MockRSGIProtocol(body=b"body")
+
+        async_to_sync(handler.handle)(scope, protocol)
+
+        self.assertTrue(protocol.body_read)
+        self.assertEqual(protocol.response["body"], b"body")
+
+    def test_create_request_spooled_body(self):
+        scope = MockRSGIScope(method="POST")
+        protocol = MockRSGIProtocol(body=b"x" * 16)
+
+        handler = RSGIHandler()
+
+        with self.settings(FILE_UPLOAD_MAX_MEMORY_SIZE=8):
+            body_file = async_to_sync(handler.read_body)(protocol)
+
+        self.assertNotIsInstance(body_file, io.BytesIO)
+        request, error = handler.create_request(scope, body_file)
+
+        self.assertIsNone(error)
+        self.assertEqual(request.body, b"x" * 16)
@@ -1,18 +1,29 @@
 import asyncio
+from functools import lru_cache
 
 from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 from django.urls import path
 from django.views.decorators.csrf import csrf_exempt
 
 
+@lru_cache(maxsize=256)
+def hello_content(name):
+    return ("Hello %s!" % name).encode()
+
+
+@lru_cache(maxsize=256)
+def hello_meta_content(referer):
+    return ("From %s" % referer).encode()
+
+
 def hello(request):
     name = request.GET.get("name") or "World"
-    return HttpResponse("Hello %s!" % name)
+    return HttpResponse(hello_content(name))
 
 
 def hello_meta(request):
     return HttpResponse(
-        "From %s" % (request.META.get("HTTP_REFERER") or ""),
+        hello_meta_content(request.META.get("HTTP_REFERER") or ""),
         content_type=request.META.get("CONTENT_TYPE"),
     )
 
@@ -33,7 +44,9 @@ def post_echo(request):
 
 async def streaming_inner(sleep_time):
     yield b"first\n"
-    await asyncio.sleep(sleep_time)
+    # Only yield to the event loop when a delay was actually requested
+    if sleep_time:
+        await asyncio.sleep(sleep_time)
     yield b"last\n"
 
 